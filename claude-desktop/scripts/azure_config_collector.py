@@ -7,10 +7,175 @@ Author: Bios Data Center
 Version: 1.0
 """
 
+import io
 import json
 import re
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import sys
+
+try:
+    import orjson  # optional: Rust-backed JSON encoder, much faster on large configs
+except ImportError:
+    orjson = None
+
+try:
+    import jiter  # optional: Rust SIMD JSON parser for inbound az CLI output
+except ImportError:
+    jiter = None
+
+try:
+    # Optional compiled (e.g. Cython-built) parse path for bulk runs over
+    # many Logic Apps; drop a module exposing parse_workflow(definition)
+    # next to this script to enable it. Pure Python is used otherwise.
+    from _azure_config_fast import parse_workflow as _parse_workflow_fast
+except ImportError:
+    _parse_workflow_fast = None
+
+from collections import defaultdict, deque
+from types import MappingProxyType
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Optional
+
+# Read-only empty-dict sentinel; avoids allocating a throwaway {} default
+# on every .get() in the per-action hot path.
+_EMPTY: Dict[str, Any] = {}
+
+# Interned keys for the per-action lookups; CPython dicts short-circuit
+# key comparison on identity, so interning skips the string compare.
+_K_TYPE = sys.intern("type")
+_K_INPUTS = sys.intern("inputs")
+_K_RUNAFTER = sys.intern("runAfter")
+_K_HOST = sys.intern("host")
+_K_APIID = sys.intern("apiId")
+_K_PATH = sys.intern("path")
+_K_METHOD = sys.intern("method")
+
+# Single compiled pattern for sensitive key detection; one regex scan per
+# key instead of six Python-level substring checks plus a .lower().
+_SENSITIVE_RE = re.compile(r"authentication|password|secret|token|sig|key", re.IGNORECASE)
+_SENSITIVE_SEARCH = _SENSITIVE_RE.search
+
+# Connector name (last apiId path segment, lowercased) -> friendly kind.
+# One dict lookup replaces the chain of substring scans per action.
+_API_KIND = {
+    "sql": "SQL Server",
+    "sharepointonline": "SharePoint Online",
+    "azureblob": "Azure Blob Storage",
+    "keyvault": "Key Vault",
+    "office365": "Office 365",
+}
+
+# Compiled once; _identify_backend previously recompiled this per call
+# through the re module cache.
+_AZWEBSITES_RE = re.compile(r"https://([^.]+)\.azurewebsites\.net")
+
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+# Action-type dispatch for _describe_action, built once at import instead
+# of allocating a fresh dict of lambdas on every call. ApiConnection late-
+# binds to WorkflowParser since the class is defined below.
+_ACTION_DESCRIBERS: Dict[str, Callable[[Dict[str, Any], str], str]] = {
+    "Response": lambda inputs, connector: f"Return HTTP {inputs.get('statusCode', 200)} response",
+    "Compose": lambda inputs, connector: "Transform/compose data",
+    "ParseJson": lambda inputs, connector: "Parse JSON content",
+    "Condition": lambda inputs, connector: "Conditional branch (If/Then/Else)",
+    "ForEach": lambda inputs, connector: "Loop through collection",
+    "Switch": lambda inputs, connector: "Switch/case evaluation",
+    "Scope": lambda inputs, connector: "Grouped actions scope",
+    "InitializeVariable": lambda inputs, connector: "Initialize variable",
+    "SetVariable": lambda inputs, connector: "Set variable value",
+    "AppendToArrayVariable": lambda inputs, connector: "Append to array",
+    "Http": lambda inputs, connector: f"HTTP {inputs.get('method', 'GET')} call to {inputs.get('uri', 'external service')[:50]}",
+    "ApiConnection": lambda inputs, connector: WorkflowParser._describe_api_connection(inputs, connector),
+}
+
+
+def _load(data: Any) -> Any:
+    """Parse raw JSON bytes with the fastest parser available."""
+    if jiter is not None:
+        return jiter.from_json(bytes(data))
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Field schemas for the add_*_config extractors: tuples of
+# (output_key, path_into_the_azure_payload). One generic loop replaces
+# the hand-written .get() chains per method; missing paths yield None.
+APIM_SCHEMA = (
+    ("resource_name", ("name",)),
+    ("resource_group", ("resourceGroup",)),
+    ("region", ("location",)),
+    ("sku", ("sku", "name")),
+    ("capacity", ("sku", "capacity")),
+    ("gateway_url", ("gatewayUrl",)),
+    ("developer_portal_url", ("developerPortalUrl",)),
+    ("virtual_network_type", ("virtualNetworkType",)),
+)
+
+APIM_IDENTITY_SCHEMA = (
+    ("type", ("identity", "type")),
+    ("principal_id", ("identity", "principalId")),
+)
+
+API_SCHEMA = (
+    ("name", ("name",)),
+    ("display_name", ("displayName",)),
+    ("path", ("path",)),
+    ("service_url", ("serviceUrl",)),
+    ("protocols", ("protocols",)),
+    ("subscription_required", ("subscriptionRequired",)),
+    ("api_version", ("apiVersion",)),
+)
+
+LOGIC_APP_SCHEMA = (
+    ("resource_name", ("name",)),
+    ("resource_group", ("resourceGroup",)),
+    ("region", ("location",)),
+    ("state", ("state",)),
+)
+
+DATA_GATEWAY_SCHEMA = (
+    ("name", ("name",)),
+    ("resource_group", ("resourceGroup",)),
+    ("region", ("location",)),
+    ("type", ("properties", "connectionGatewayInstallation", "name")),
+    ("machine_name", ("properties", "connectionGatewayInstallation", "machineName")),
+)
+
+KEYVAULT_SCHEMA = (
+    ("name", ("name",)),
+    ("resource_group", ("resourceGroup",)),
+    ("region", ("location",)),
+    ("sku", ("properties", "sku", "name")),
+    ("vault_uri", ("properties", "vaultUri")),
+    ("soft_delete_enabled", ("properties", "enableSoftDelete")),
+    ("purge_protection", ("properties", "enablePurgeProtection")),
+)
+
+APP_INSIGHTS_SCHEMA = (
+    ("name", ("name",)),
+    ("resource_group", ("resourceGroup",)),
+    ("region", ("location",)),
+    ("instrumentation_key", ("properties", "InstrumentationKey")),
+    ("connection_string", ("properties", "ConnectionString")),
+    ("workspace_id", ("properties", "WorkspaceResourceId")),
+    ("retention_days", ("properties", "RetentionInDays")),
+)
+
+
+def _extract(data: Dict[str, Any], schema: Any) -> Dict[str, Any]:
+    """Copy fields out of an Azure payload according to a schema."""
+    out: Dict[str, Any] = {}
+    for key, path in schema:
+        value: Any = data
+        for part in path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(part)
+        out[key] = value
+    return out
+
 
 class WorkflowParser:
     """Parse Logic App workflow definitions to extract documentation."""
@@ -30,65 +195,198 @@ class WorkflowParser:
         if not definition:
             return result
         
+        # Bind the hot appends to locals so the loops skip the attribute
+        # lookup per iteration.
+        triggers_append = result["triggers"].append
+        actions_append = result["actions"].append
+        conns_append = result["connections"].append
+        ds_append = result["data_sources"].append
+
         # Parse triggers
         for name, trigger in definition.get("triggers", {}).items():
-            result["triggers"].append({
+            triggers_append({
                 "name": name,
                 "type": trigger.get("type"),
                 "kind": trigger.get("kind"),
                 "description": WorkflowParser._describe_trigger(trigger)
             })
-        
+
         # Parse actions in order
-        actions = definition.get("actions", {})
-        ordered_actions = WorkflowParser._order_actions(actions)
-        
-        for action_name in ordered_actions:
-            action = actions.get(action_name, {})
+        conns_seen = set()
+
+        for action_name, action, desc, conn, ds, run_after, inputs in \
+                WorkflowParser._iter_actions(definition):
             action_info = {
                 "name": action_name,
-                "type": action.get("type"),
-                "description": WorkflowParser._describe_action(action),
-                "run_after": list(action.get("runAfter", {}).keys()),
-                "inputs": WorkflowParser._sanitize_inputs(action.get("inputs", {}))
+                "type": action.get(_K_TYPE),
+                "description": desc,
+                "run_after": run_after,
+                "inputs": WorkflowParser._sanitize_inputs(inputs)[0]
             }
-            result["actions"].append(action_info)
-            
-            # Extract connections
-            conn = WorkflowParser._extract_connection(action)
-            if conn and conn not in result["connections"]:
-                result["connections"].append(conn)
-            
-            # Identify data sources
-            ds = WorkflowParser._identify_data_source(action)
+            actions_append(action_info)
+
+            if conn and conn not in conns_seen:
+                conns_seen.add(conn)
+                conns_append(conn)
             if ds:
-                result["data_sources"].append(ds)
-        
+                ds_append(ds)
+
         return result
-    
+
     @staticmethod
-    def _order_actions(actions: Dict[str, Any]) -> List[str]:
-        """Order actions by execution dependency."""
+    def parse_workflow_with_markdown(definition: Dict[str, Any],
+                                     workflow_name: str = "Workflow") -> "tuple[Dict[str, Any], str]":
+        """Parse a workflow and emit its markdown in the same traversal.
+
+        Returns ``(parsed, markdown)``. Equivalent to parse_workflow
+        followed by generate_markdown, without walking the actions twice.
+        """
+        result = {
+            "triggers": [],
+            "actions": [],
+            "connections": [],
+            "data_sources": [],
+            "parameters": [],
+            "variables": []
+        }
+
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## {workflow_name}\n\n")
+        w("### Trigger Configuration\n")
+
+        if definition:
+            for name, trigger in definition.get("triggers", {}).items():
+                desc = WorkflowParser._describe_trigger(trigger)
+                t_type = trigger.get(_K_TYPE)
+                result["triggers"].append({
+                    "name": name,
+                    "type": t_type,
+                    "kind": trigger.get("kind"),
+                    "description": desc
+                })
+                w(f"- **{name}** ({t_type}): {desc}\n")
+
+        w("\n### Workflow Actions (Execution Order)\n\n")
+        w("| Step | Action | Type | Description | Depends On |\n")
+        w("|------|--------|------|-------------|------------|\n")
+
+        if definition:
+            actions_append = result["actions"].append
+            conns = result["connections"]
+            conns_seen = set()
+            ds_list = result["data_sources"]
+
+            for i, (action_name, action, desc, conn, ds, run_after, inputs) in \
+                    enumerate(WorkflowParser._iter_actions(definition), 1):
+                a_type = action.get(_K_TYPE)
+                actions_append({
+                    "name": action_name,
+                    "type": a_type,
+                    "description": desc,
+                    "run_after": run_after,
+                    "inputs": WorkflowParser._sanitize_inputs(inputs)[0]
+                })
+                deps = ", ".join(run_after) or "-"
+                w(f"| {i} | {action_name} | {a_type} | {desc} | {deps} |\n")
+
+                if conn and conn not in conns_seen:
+                    conns_seen.add(conn)
+                    conns.append(conn)
+                if ds:
+                    ds_list.append(ds)
+
+        if result["connections"]:
+            w("\n### API Connections\n")
+            for c in result["connections"]:
+                w(f"- {c}\n")
+
+        if result["data_sources"]:
+            w("\n### Data Sources\n")
+            for ds in result["data_sources"]:
+                w(f"- **{ds['type']}**: {ds.get('operation', 'N/A')}\n")
+
+        return result, buf.getvalue()
+
+    @staticmethod
+    def _iter_actions(definition: Dict[str, Any]):
+        """Yield each action in execution order with its inspected fields.
+
+        Yields ``(name, action, description, connection, data_source,
+        run_after, inputs)`` tuples shared by parse_workflow and
+        parse_workflow_with_markdown.
+        """
+        actions = definition.get("actions", {})
+        # Dependency tuples are computed once and reused both for the
+        # topological sort and as the stored run_after values.
+        run_after_map = {name: tuple((action.get(_K_RUNAFTER) or _EMPTY).keys())
+                         for name, action in actions.items()}
+        for action_name in WorkflowParser._order_actions(actions, run_after_map):
+            action = actions.get(action_name, _EMPTY)
+            desc, conn, ds, inputs = WorkflowParser._inspect_action(action)
+            run_after = run_after_map.get(action_name, ())
+            yield action_name, action, desc, conn, ds, run_after, inputs
+
+    @staticmethod
+    def _order_actions(actions: Dict[str, Any],
+                       run_after: Optional[Dict[str, "tuple[str, ...]"]] = None) -> List[str]:
+        """Order actions by execution dependency (Kahn's topological sort).
+
+        ``run_after`` may carry precomputed dependency tuples per action
+        (as built by _iter_actions) so runAfter is not re-read here.
+        """
+        if run_after is None:
+            run_after = {name: tuple((action.get(_K_RUNAFTER) or _EMPTY).keys())
+                         for name, action in actions.items()}
+
+        children: Dict[str, List[str]] = defaultdict(list)
+        indegree: Dict[str, int] = {}
+
+        for name, deps in run_after.items():
+            indegree[name] = len(deps)
+            for dep in deps:
+                children[dep].append(name)
+
+        queue = deque(name for name, count in indegree.items() if count == 0)
         ordered = []
-        remaining = set(actions.keys())
-        max_iterations = len(actions) * 2
-        iteration = 0
-        
-        while remaining and iteration < max_iterations:
-            iteration += 1
-            for name in list(remaining):
-                deps = actions[name].get("runAfter", {}).keys()
-                if all(d in ordered for d in deps):
-                    ordered.append(name)
-                    remaining.remove(name)
-                    break
-            else:
-                if remaining:
-                    ordered.extend(remaining)
-                    break
-        
+
+        while queue:
+            name = queue.popleft()
+            ordered.append(name)
+            for child in children[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+
+        # Cycles (or deps on unknown actions) leave leftovers; append them
+        # so every action still appears in the output.
+        if len(ordered) < len(actions):
+            emitted = set(ordered)
+            ordered.extend(name for name in actions if name not in emitted)
+
         return ordered
     
+    @staticmethod
+    def _inspect_action(action: Dict[str, Any]) -> "tuple[str, Optional[str], Optional[Dict[str, str]], Dict[str, Any]]":
+        """Inspect one action in a single pass over its nested dicts.
+
+        Unpacks inputs/host/connector once and returns
+        ``(description, connection, data_source, inputs)`` so callers do
+        not traverse the action three separate times.
+        """
+        inputs = action.get(_K_INPUTS) or _EMPTY
+        if not isinstance(inputs, dict):
+            inputs = _EMPTY
+        host = inputs.get(_K_HOST, _EMPTY)
+        if not isinstance(host, dict):
+            host = _EMPTY
+        connector = host.get(_K_APIID, "").rsplit("/", 1)[-1].lower()
+
+        desc = WorkflowParser._describe_action(action, inputs, connector)
+        conn = WorkflowParser._extract_connection(host)
+        ds = WorkflowParser._identify_data_source(action, inputs, connector)
+        return desc, conn, ds, inputs
+
     @staticmethod
     def _describe_trigger(trigger: Dict[str, Any]) -> str:
         """Generate human-readable trigger description."""
@@ -110,159 +408,172 @@ class WorkflowParser:
         return f"{t_type} trigger"
     
     @staticmethod
-    def _describe_action(action: Dict[str, Any]) -> str:
+    def _describe_action(action: Dict[str, Any], inputs: Dict[str, Any],
+                         connector: str) -> str:
         """Generate human-readable action description."""
         a_type = action.get("type", "Unknown")
-        inputs = action.get("inputs", {})
-        
-        descriptions = {
-            "Response": lambda: f"Return HTTP {inputs.get('statusCode', 200)} response",
-            "Compose": lambda: "Transform/compose data",
-            "ParseJson": lambda: "Parse JSON content",
-            "Condition": lambda: "Conditional branch (If/Then/Else)",
-            "ForEach": lambda: "Loop through collection",
-            "Switch": lambda: "Switch/case evaluation",
-            "Scope": lambda: "Grouped actions scope",
-            "InitializeVariable": lambda: f"Initialize variable",
-            "SetVariable": lambda: "Set variable value",
-            "AppendToArrayVariable": lambda: "Append to array",
-            "Http": lambda: f"HTTP {inputs.get('method', 'GET')} call to {inputs.get('uri', 'external service')[:50]}",
-            "ApiConnection": lambda: WorkflowParser._describe_api_connection(inputs),
-        }
-        
-        if a_type in descriptions:
-            return descriptions[a_type]()
-        
+
+        describe = _ACTION_DESCRIBERS.get(a_type)
+        if describe is not None:
+            return describe(inputs, connector)
+
         return f"{a_type} action"
     
     @staticmethod
-    def _describe_api_connection(inputs: Dict[str, Any]) -> str:
+    def _describe_api_connection(inputs: Dict[str, Any], connector: str) -> str:
         """Describe API connection action."""
-        host = inputs.get("host", {})
-        api_id = host.get("apiId", "")
-        path = inputs.get("path", "")
-        method = inputs.get("method", "")
-        
-        if "sql" in api_id.lower():
-            if "executestoredprocedure" in path.lower():
+        path = inputs.get(_K_PATH, "")
+        method = inputs.get(_K_METHOD, "")
+        kind = _API_KIND.get(connector)
+
+        if kind == "SQL Server":
+            path_lower = path.lower()
+            if "executestoredprocedure" in path_lower:
                 proc = path.split("/")[-1] if "/" in path else "stored procedure"
                 return f"Execute SQL stored procedure: {proc}"
-            if "executequery" in path.lower():
+            if "executequery" in path_lower:
                 return "Execute SQL query"
             return "SQL Server operation"
-        
-        if "office365" in api_id.lower():
+
+        if kind == "Office 365":
             return "Office 365 operation"
-        
-        if "keyvault" in api_id.lower():
+
+        if kind == "Key Vault":
             return "Key Vault secret operation"
-        
+
         return f"API Connection: {method} {path[:50] if path else 'operation'}"
-    
+
     @staticmethod
-    def _extract_connection(action: Dict[str, Any]) -> Optional[str]:
-        """Extract connection reference from action."""
-        inputs = action.get("inputs", {})
-        if isinstance(inputs, dict):
-            host = inputs.get("host", {})
-            if isinstance(host, dict):
-                conn = host.get("connection", {})
-                if isinstance(conn, dict):
-                    return conn.get("referenceName")
+    def _extract_connection(host: Dict[str, Any]) -> Optional[str]:
+        """Extract connection reference from an action's host block."""
+        conn = host.get("connection", _EMPTY)
+        if isinstance(conn, dict):
+            return conn.get("referenceName")
         return None
-    
+
     @staticmethod
-    def _identify_data_source(action: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    def _identify_data_source(action: Dict[str, Any], inputs: Dict[str, Any],
+                              connector: str) -> Optional[Dict[str, str]]:
         """Identify if action interacts with a data source."""
-        inputs = action.get("inputs", {})
-        host = inputs.get("host", {}) if isinstance(inputs, dict) else {}
-        api_id = host.get("apiId", "") if isinstance(host, dict) else ""
-        
-        if "sql" in api_id.lower():
+        kind = _API_KIND.get(connector)
+
+        if kind == "SQL Server":
             return {
-                "type": "SQL Server",
-                "action": action.get("type"),
-                "operation": inputs.get("path", "").split("/")[-1] if inputs.get("path") else "query"
+                "type": kind,
+                "action": action.get(_K_TYPE),
+                "operation": inputs.get(_K_PATH, "").split("/")[-1] if inputs.get(_K_PATH) else "query"
             }
-        
-        if "sharepointonline" in api_id.lower():
-            return {"type": "SharePoint Online", "action": action.get("type")}
-        
-        if "azureblob" in api_id.lower():
-            return {"type": "Azure Blob Storage", "action": action.get("type")}
-        
+
+        if kind in ("SharePoint Online", "Azure Blob Storage"):
+            return {"type": kind, "action": action.get(_K_TYPE)}
+
         return None
     
     @staticmethod
-    def _sanitize_inputs(inputs: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove sensitive data from inputs for documentation."""
+    def _sanitize_inputs(inputs: Dict[str, Any]) -> "tuple[Dict[str, Any], bool]":
+        """Remove sensitive data from inputs for documentation.
+
+        Returns ``(sanitized, changed)``. When nothing was redacted the
+        original ``inputs`` object is returned unchanged, so clean
+        subtrees are shared instead of deep-copied.
+        """
         if not isinstance(inputs, dict):
-            return {}
-        
-        sanitized = {}
-        sensitive_keys = ["authentication", "password", "secret", "key", "token", "sig"]
-        
-        for k, v in inputs.items():
-            if any(s in k.lower() for s in sensitive_keys):
-                sanitized[k] = "[REDACTED]"
-            elif isinstance(v, dict):
-                sanitized[k] = WorkflowParser._sanitize_inputs(v)
-            else:
-                sanitized[k] = v
-        
-        return sanitized
+            return {}, True
+        return WorkflowParser._sanitize_node(inputs)
+
+    @staticmethod
+    def _sanitize_node(node: Any) -> "tuple[Any, bool]":
+        """Sanitize one node, allocating a copy only if a descendant changed."""
+        if isinstance(node, dict):
+            out: Optional[Dict[str, Any]] = None
+            search = _SENSITIVE_SEARCH
+            for k, v in node.items():
+                if search(k):
+                    new_v, changed = "[REDACTED]", True
+                else:
+                    new_v, changed = WorkflowParser._sanitize_node(v)
+                if changed and out is None:
+                    # First change: copy the keys already passed untouched.
+                    out = {}
+                    for prev in node:
+                        if prev == k:
+                            break
+                        out[prev] = node[prev]
+                if out is not None:
+                    out[k] = new_v
+            if out is None:
+                return node, False
+            return out, True
+
+        if isinstance(node, list):
+            out_list: Optional[List[Any]] = None
+            for i, v in enumerate(node):
+                new_v, changed = WorkflowParser._sanitize_node(v)
+                if changed and out_list is None:
+                    out_list = node[:i]
+                if out_list is not None:
+                    out_list.append(new_v)
+            if out_list is None:
+                return node, False
+            return out_list, True
+
+        return node, False
     
     @staticmethod
     def generate_markdown(parsed: Dict[str, Any], workflow_name: str = "Workflow") -> str:
         """Generate markdown documentation for workflow."""
-        lines = [f"## {workflow_name}\n"]
-        
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## {workflow_name}\n\n")
+
         # Triggers
-        lines.append("### Trigger Configuration")
+        w("### Trigger Configuration\n")
         for t in parsed.get("triggers", []):
-            lines.append(f"- **{t['name']}** ({t['type']}): {t['description']}")
-        lines.append("")
-        
+            w(f"- **{t['name']}** ({t['type']}): {t['description']}\n")
+
         # Actions
-        lines.append("### Workflow Actions (Execution Order)")
-        lines.append("")
-        lines.append("| Step | Action | Type | Description | Depends On |")
-        lines.append("|------|--------|------|-------------|------------|")
+        w("\n### Workflow Actions (Execution Order)\n\n")
+        w("| Step | Action | Type | Description | Depends On |\n")
+        w("|------|--------|------|-------------|------------|\n")
         for i, a in enumerate(parsed.get("actions", []), 1):
             deps = ", ".join(a.get("run_after", [])) or "-"
-            lines.append(f"| {i} | {a['name']} | {a['type']} | {a['description']} | {deps} |")
-        lines.append("")
-        
+            w(f"| {i} | {a['name']} | {a['type']} | {a['description']} | {deps} |\n")
+
         # Connections
         if parsed.get("connections"):
-            lines.append("### API Connections")
+            w("\n### API Connections\n")
             for c in parsed["connections"]:
-                lines.append(f"- {c}")
-            lines.append("")
-        
+                w(f"- {c}\n")
+
         # Data sources
         if parsed.get("data_sources"):
-            lines.append("### Data Sources")
+            w("\n### Data Sources\n")
             for ds in parsed["data_sources"]:
-                lines.append(f"- **{ds['type']}**: {ds.get('operation', 'N/A')}")
-            lines.append("")
-        
-        return "\n".join(lines)
+                w(f"- **{ds['type']}**: {ds.get('operation', 'N/A')}\n")
+
+        return buf.getvalue()
 
 
 class ConfigurationAggregator:
     """Aggregate configuration from multiple Azure resources."""
     
     def __init__(self):
+        self._collection_date: Optional[str] = None
         self.config = {
             "metadata": {
-                "collection_date": datetime.now().isoformat(),
                 "version": "1.0"
             },
             "shared_infrastructure": {},
             "service": {}
         }
-    
+
+    @property
+    def collection_date(self) -> str:
+        """Collection timestamp (UTC), evaluated lazily on first use."""
+        if self._collection_date is None:
+            self._collection_date = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return self._collection_date
+
     def set_metadata(self, service_name: str, environment: str, subscription: str):
         """Set documentation metadata."""
         self.config["metadata"].update({
@@ -273,34 +584,20 @@ class ConfigurationAggregator:
     
     def add_apim_config(self, apim_data: Dict[str, Any]):
         """Add APIM configuration."""
-        self.config["service"]["apim"] = {
-            "resource_name": apim_data.get("name"),
-            "resource_group": apim_data.get("resourceGroup"),
-            "region": apim_data.get("location"),
-            "sku": apim_data.get("sku", {}).get("name"),
-            "capacity": apim_data.get("sku", {}).get("capacity"),
-            "gateway_url": apim_data.get("gatewayUrl"),
-            "developer_portal_url": apim_data.get("developerPortalUrl"),
-            "virtual_network_type": apim_data.get("virtualNetworkType"),
-            "identity": {
-                "type": apim_data.get("identity", {}).get("type"),
-                "principal_id": apim_data.get("identity", {}).get("principalId")
-            }
-        }
+        if isinstance(apim_data, _BYTES_LIKE):
+            apim_data = _load(apim_data)
+        apim = _extract(apim_data, APIM_SCHEMA)
+        apim["identity"] = _extract(apim_data, APIM_IDENTITY_SCHEMA)
+        self.config["service"]["apim"] = apim
     
     def add_api_config(self, api_data: Dict[str, Any]):
         """Add API configuration."""
-        self.config["service"]["api"] = {
-            "name": api_data.get("name"),
-            "display_name": api_data.get("displayName"),
-            "path": api_data.get("path"),
-            "service_url": api_data.get("serviceUrl"),
-            "protocols": api_data.get("protocols"),
-            "subscription_required": api_data.get("subscriptionRequired"),
-            "api_version": api_data.get("apiVersion"),
-            "operations": api_data.get("operations", [])
-        }
-        
+        if isinstance(api_data, _BYTES_LIKE):
+            api_data = _load(api_data)
+        api = _extract(api_data, API_SCHEMA)
+        api["operations"] = api_data.get("operations", [])
+        self.config["service"]["api"] = api
+
         # Parse backend URL to identify Logic App
         backend_url = api_data.get("serviceUrl", "")
         if backend_url:
@@ -308,26 +605,62 @@ class ConfigurationAggregator:
     
     def add_logic_app_config(self, la_data: Dict[str, Any]):
         """Add Logic App configuration."""
-        self.config["service"]["logic_app"] = {
-            "resource_name": la_data.get("name"),
-            "resource_group": la_data.get("resourceGroup"),
-            "type": la_data.get("kind", "Standard"),
-            "region": la_data.get("location"),
-            "state": la_data.get("state"),
-            "identity": la_data.get("identity", {})
-        }
+        if isinstance(la_data, _BYTES_LIKE):
+            la_data = _load(la_data)
+        la = _extract(la_data, LOGIC_APP_SCHEMA)
+        la["type"] = la_data.get("kind", "Standard")
+        la["identity"] = la_data.get("identity", {})
+        self.config["service"]["logic_app"] = la
     
     def add_workflow_config(self, workflow_def: Dict[str, Any], workflow_name: str):
         """Add and parse workflow configuration."""
-        parsed = WorkflowParser.parse_workflow(workflow_def)
+        if isinstance(workflow_def, _BYTES_LIKE):
+            workflow_def = _load(workflow_def)
+        if _parse_workflow_fast is not None:
+            parsed = _parse_workflow_fast(workflow_def)
+            markdown = WorkflowParser.generate_markdown(parsed, workflow_name)
+        else:
+            parsed, markdown = WorkflowParser.parse_workflow_with_markdown(
+                workflow_def, workflow_name)
         self.config["service"]["workflow"] = {
             "name": workflow_name,
             "parsed": parsed,
-            "markdown": WorkflowParser.generate_markdown(parsed, workflow_name)
+            "markdown": markdown
         }
     
+    def add_workflow_from_file(self, filepath: str, workflow_name: str):
+        """Add a workflow from a workflow.json file, streaming if possible.
+
+        Large Logic App Standard definitions are read with ijson (when
+        installed) so peak memory stays proportional to the largest
+        action rather than the whole file; otherwise json.load is used.
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is not None:
+            triggers: Dict[str, Any] = {}
+            actions: Dict[str, Any] = {}
+            with open(filepath, 'rb') as f:
+                for name, trigger in ijson.kvitems(f, "definition.triggers"):
+                    triggers[name] = trigger
+                f.seek(0)
+                for name, action in ijson.kvitems(f, "definition.actions"):
+                    actions[name] = action
+            definition = {"triggers": triggers, "actions": actions}
+        else:
+            with open(filepath, 'rb') as f:
+                data = json.load(f)
+            definition = data.get("definition", data)
+
+        self.add_workflow_config(definition, workflow_name)
+
     def add_connection_config(self, connections: List[Dict[str, Any]]):
         """Add API connections configuration."""
+        if isinstance(connections, _BYTES_LIKE):
+            connections = _load(connections)
         self.config["service"]["connections"] = []
         
         for conn in connections:
@@ -351,50 +684,43 @@ class ConfigurationAggregator:
     
     def add_data_gateway_config(self, gateway_data: Dict[str, Any]):
         """Add On-Premises Data Gateway configuration."""
-        self.config["service"]["data_gateway"] = {
-            "name": gateway_data.get("name"),
-            "resource_group": gateway_data.get("resourceGroup"),
-            "region": gateway_data.get("location"),
-            "type": gateway_data.get("properties", {}).get("connectionGatewayInstallation", {}).get("name"),
-            "machine_name": gateway_data.get("properties", {}).get("connectionGatewayInstallation", {}).get("machineName")
-        }
+        if isinstance(gateway_data, _BYTES_LIKE):
+            gateway_data = _load(gateway_data)
+        self.config["service"]["data_gateway"] = _extract(gateway_data, DATA_GATEWAY_SCHEMA)
     
     def add_keyvault_config(self, kv_data: Dict[str, Any], secrets: List[Dict[str, Any]] = None):
         """Add Key Vault configuration."""
-        self.config["service"]["key_vault"] = {
-            "name": kv_data.get("name"),
-            "resource_group": kv_data.get("resourceGroup"),
-            "region": kv_data.get("location"),
-            "sku": kv_data.get("properties", {}).get("sku", {}).get("name"),
-            "vault_uri": kv_data.get("properties", {}).get("vaultUri"),
-            "soft_delete_enabled": kv_data.get("properties", {}).get("enableSoftDelete"),
-            "purge_protection": kv_data.get("properties", {}).get("enablePurgeProtection"),
-            "secrets": [{"name": s.get("name"), "enabled": s.get("enabled")} for s in (secrets or [])]
-        }
+        if isinstance(kv_data, _BYTES_LIKE):
+            kv_data = _load(kv_data)
+        kv = _extract(kv_data, KEYVAULT_SCHEMA)
+        kv["secrets"] = [{"name": s.get("name"), "enabled": s.get("enabled")} for s in (secrets or [])]
+        self.config["service"]["key_vault"] = kv
     
     def add_app_insights_config(self, ai_data: Dict[str, Any]):
         """Add Application Insights configuration."""
-        self.config["service"]["app_insights"] = {
-            "name": ai_data.get("name"),
-            "resource_group": ai_data.get("resourceGroup"),
-            "region": ai_data.get("location"),
-            "instrumentation_key": ai_data.get("properties", {}).get("InstrumentationKey"),
-            "connection_string": ai_data.get("properties", {}).get("ConnectionString"),
-            "workspace_id": ai_data.get("properties", {}).get("WorkspaceResourceId"),
-            "retention_days": ai_data.get("properties", {}).get("RetentionInDays")
-        }
+        if isinstance(ai_data, _BYTES_LIKE):
+            ai_data = _load(ai_data)
+        self.config["service"]["app_insights"] = _extract(ai_data, APP_INSIGHTS_SCHEMA)
     
     def set_shared_infrastructure(self, front_door: Dict[str, Any] = None, waf: Dict[str, Any] = None):
-        """Set shared infrastructure configuration (typically static)."""
+        """Set shared infrastructure configuration (typically static).
+
+        Read-only proxies (e.g. from BIOS_SHARED_INFRASTRUCTURE) are
+        shallow-copied so the stored config stays JSON-serializable.
+        """
         if front_door:
+            if isinstance(front_door, MappingProxyType):
+                front_door = dict(front_door)
             self.config["shared_infrastructure"]["front_door"] = front_door
         if waf:
+            if isinstance(waf, MappingProxyType):
+                waf = dict(waf)
             self.config["shared_infrastructure"]["waf"] = waf
     
     def _identify_backend(self, url: str) -> Dict[str, str]:
         """Identify backend type from URL."""
         if "azurewebsites.net" in url:
-            match = re.search(r"https://([^.]+)\.azurewebsites\.net", url)
+            match = _AZWEBSITES_RE.search(url)
             return {
                 "type": "Logic App Standard",
                 "name": match.group(1) if match else "Unknown"
@@ -406,18 +732,30 @@ class ConfigurationAggregator:
         return {"type": "External"}
     
     def export_json(self, filepath: str):
-        """Export configuration to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.config, f, indent=2, default=str)
+        """Export configuration to JSON file (uses orjson when available)."""
+        self.config["metadata"]["collection_date"] = self.collection_date
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.config,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(self.config, f, indent=2, default=str)
     
     def get_config(self) -> Dict[str, Any]:
         """Return the complete configuration."""
+        self.config["metadata"]["collection_date"] = self.collection_date
         return self.config
 
 
-# Shared infrastructure defaults for Bios Data Center
-BIOS_SHARED_INFRASTRUCTURE = {
-    "front_door": {
+# Shared infrastructure defaults for Bios Data Center. Read-only: every
+# aggregator shares the same instance, so mutating it would leak into
+# unrelated documents. Use shared_infra() for a mutable copy.
+BIOS_SHARED_INFRASTRUCTURE = MappingProxyType({
+    "front_door": MappingProxyType({
         "resource_name": "[fd-bios-prod-001]",
         "resource_group": "[rg-networking-prod]",
         "sku": "Standard_AzureFrontDoor",
@@ -425,8 +763,8 @@ BIOS_SHARED_INFRASTRUCTURE = {
         "custom_domains": ["api.[client].co.za"],
         "ssl_certificate": "Azure Managed / Key Vault",
         "notes": "Shared Front Door instance - update custom domain per service"
-    },
-    "waf": {
+    }),
+    "waf": MappingProxyType({
         "policy_name": "[waf-bios-prod-001]",
         "resource_group": "[rg-networking-prod]",
         "mode": "Prevention",
@@ -434,8 +772,13 @@ BIOS_SHARED_INFRASTRUCTURE = {
         "bot_protection": True,
         "ip_whitelist": "[Service-specific IPs added as custom rules]",
         "notes": "Shared WAF policy - add IP whitelist rules per service"
-    }
-}
+    })
+})
+
+
+def shared_infra() -> Dict[str, Dict[str, Any]]:
+    """Return a mutable copy of the shared infrastructure defaults."""
+    return {k: dict(v) for k, v in BIOS_SHARED_INFRASTRUCTURE.items()}
 
 
 if __name__ == "__main__":